@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Protocol
+
+
+class Clock(Protocol):
+    """Source of the current UTC time used to stamp TODO items."""
+
+    def now(self) -> datetime:
+        """Return the current naive UTC timestamp."""
+
+
+class UtcClock:
+    """Clock that reads the system time on every call."""
+
+    def now(self) -> datetime:
+        """Return the current naive UTC timestamp."""
+        return datetime.utcnow()
+
+
+class FrozenClock:
+    """Clock that returns the same instant on every call.
+
+    Bulk operations can share one instance so every item they touch gets the
+    same timestamp from a single clock read.
+    """
+
+    def __init__(self, instant: datetime | None = None) -> None:
+        """Initialize the clock.
+
+        Args:
+            instant: Timestamp to return. Defaults to the current UTC time.
+        """
+        self._instant = instant or datetime.utcnow()
+
+    def now(self) -> datetime:
+        """Return the frozen timestamp."""
+        return self._instant
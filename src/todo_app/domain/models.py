@@ -2,18 +2,19 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import date, datetime
-from enum import Enum, auto
+from enum import IntEnum, auto
+from typing import NamedTuple
 
 
-class Status(Enum):
-    """Status of a TODO item."""
+class Status(IntEnum):
+    """Status of a TODO item, stored by its integer value."""
 
     PENDING = auto()
     DONE = auto()
 
 
-class Priority(Enum):
-    """Priority level of a TODO item."""
+class Priority(IntEnum):
+    """Priority level of a TODO item, stored by its integer value."""
 
     LOW = auto()
     MEDIUM = auto()
@@ -45,3 +46,19 @@ class TodoItem:
     due_date: date | None = None
     priority: Priority | None = None
     tags: list[str] = field(default_factory=list)
+
+
+class TodoSummary(NamedTuple):
+    """Lightweight read-only view of a TODO item for list displays.
+
+    Attributes:
+        id: Unique identifier in the persistence layer.
+        title: Short title of the TODO item.
+        status: Current status of the TODO item.
+        due_date: Optional calendar date by which the TODO should be completed.
+    """
+
+    id: int
+    title: str
+    status: Status
+    due_date: date | None
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from datetime import date, datetime
 from typing import Protocol
 
-from .models import Status, TodoItem
+from .models import Priority, Status, TodoItem, TodoSummary
 
 
 class TodoRepository(Protocol):
@@ -15,8 +16,52 @@ class TodoRepository(Protocol):
         """Persist a new TODO item and return it with an assigned id."""
 
     @abstractmethod
-    def list_all(self) -> Sequence[TodoItem]:
-        """Return all TODO items."""
+    def bulk_add(self, items: Sequence[TodoItem]) -> list[TodoItem]:
+        """Persist several new TODO items at once and return them with ids."""
+
+    @abstractmethod
+    def list_all(
+        self,
+        status: Status | None = None,
+        priority: Priority | None = None,
+        due_on_or_before: date | None = None,
+        limit: int | None = None,
+        after_id: int | None = None,
+    ) -> Sequence[TodoItem]:
+        """Return TODO items matching the given filters.
+
+        Args:
+            status: Optional status to filter by.
+            priority: Optional priority to filter by.
+            due_on_or_before: If set, restrict to TODOs with a due date on or
+                before this date. Items without a due date are excluded.
+            limit: Maximum number of items to return. None returns them all.
+            after_id: Id of the last item of the previous page; only items
+                listed after it are returned.
+
+        Returns:
+            The matching TODO items, newest first.
+
+        Raises:
+            ValueError: If `after_id` does not match an existing item.
+        """
+
+    @abstractmethod
+    def list_summaries(
+        self,
+        status: Status | None = None,
+        priority: Priority | None = None,
+        due_on_or_before: date | None = None,
+    ) -> Sequence[TodoSummary]:
+        """Return summaries of the TODO items matching the given filters.
+
+        Takes the same filters as `list_all` but only loads the fields of
+        `TodoSummary`, newest first.
+        """
+
+    @abstractmethod
+    def iter_all(self) -> Iterator[TodoItem]:
+        """Yield all TODO items, newest first, without loading them at once."""
 
     @abstractmethod
     def get(self, item_id: int) -> TodoItem | None:
@@ -31,7 +76,15 @@ class TodoRepository(Protocol):
         """Delete a TODO item by its id."""
 
     @abstractmethod
-    def set_status(self, item_id: int, status: Status) -> TodoItem | None:
+    def set_status(
+        self,
+        item_id: int,
+        status: Status,
+        *,
+        updated_at: datetime | None = None,
+    ) -> TodoItem | None:
         """Set the status of a TODO item and return the updated item,
         or None if not found.
+
+        `updated_at` defaults to the current time when omitted.
         """
@@ -3,9 +3,12 @@ from __future__ import annotations
 from collections.abc import Sequence
 from datetime import date, datetime
 
-from .models import Priority, Status, TodoItem
+from .clock import Clock, UtcClock
+from .models import Priority, Status, TodoItem, TodoSummary
 from .repositories import TodoRepository
 
+_DEFAULT_CLOCK: Clock = UtcClock()
+
 
 def create_todo(
     repo: TodoRepository,
@@ -14,6 +17,7 @@ def create_todo(
     due_date: date | None = None,
     priority: Priority | None = None,
     tags: Sequence[str] | None = None,
+    clock: Clock | None = None,
 ) -> TodoItem:
     """Create and persist a new TODO item.
 
@@ -24,11 +28,12 @@ def create_todo(
         due_date: Optional due date of the TODO item.
         priority: Optional priority for the TODO item.
         tags: Optional sequence of tags to associate with the TODO.
+        clock: Clock used for the timestamps. Defaults to the system UTC clock.
 
     Returns:
         The persisted TODO item with an assigned identifier.
     """
-    now: datetime = datetime.utcnow()
+    now: datetime = (clock or _DEFAULT_CLOCK).now()
     item_tags = [t.strip() for t in (tags or []) if t.strip()]
     item = TodoItem(
         id=None,
@@ -50,6 +55,8 @@ def list_todos(
     priority: Priority | None = None,
     due_today_or_overdue: bool = False,
     reference_date: date | None = None,
+    limit: int | None = None,
+    after_id: int | None = None,
 ) -> Sequence[TodoItem]:
     """List TODO items with optional filtering.
 
@@ -61,35 +68,71 @@ def list_todos(
             on or before the reference_date.
         reference_date: Date used for due-date comparison. If None, today's date
             will be used when due_today_or_overdue is True.
+        limit: Maximum number of items to return. None returns them all.
+        after_id: Id of the last item of the previous page, if paginating.
 
     Returns:
         A sequence of TODO items after applying the filters.
+
+    Raises:
+        ValueError: If `after_id` does not match an existing item.
     """
-    items = list(repo.list_all())
+    due_on_or_before: date | None = None
+    if due_today_or_overdue:
+        due_on_or_before = reference_date or date.today()
+
+    return repo.list_all(
+        status=status,
+        priority=priority,
+        due_on_or_before=due_on_or_before,
+        limit=limit,
+        after_id=after_id,
+    )
+
 
-    if status is not None:
-        items = [item for item in items if item.status == status]
+def list_todo_summaries(
+    repo: TodoRepository,
+    status: Status | None = None,
+    priority: Priority | None = None,
+    due_today_or_overdue: bool = False,
+    reference_date: date | None = None,
+) -> Sequence[TodoSummary]:
+    """List lightweight TODO summaries with optional filtering.
 
-    if priority is not None:
-        items = [item for item in items if item.priority == priority]
+    Args:
+        repo: Repository used to read TODO items.
+        status: Optional status to filter by.
+        priority: Optional priority to filter by.
+        due_today_or_overdue: If True, restrict to TODOs with a due date that is
+            on or before the reference_date.
+        reference_date: Date used for due-date comparison. If None, today's date
+            will be used when due_today_or_overdue is True.
 
+    Returns:
+        A sequence of TODO summaries after applying the filters.
+    """
+    due_on_or_before: date | None = None
     if due_today_or_overdue:
-        ref_date = reference_date or date.today()
-        items = [
-            item
-            for item in items
-            if item.due_date is not None and item.due_date <= ref_date
-        ]
+        due_on_or_before = reference_date or date.today()
 
-    return items
+    return repo.list_summaries(
+        status=status,
+        priority=priority,
+        due_on_or_before=due_on_or_before,
+    )
 
 
-def toggle_done(repo: TodoRepository, item_id: int) -> TodoItem | None:
+def toggle_done(
+    repo: TodoRepository,
+    item_id: int,
+    clock: Clock | None = None,
+) -> TodoItem | None:
     """Toggle the status of a TODO item between pending and done.
 
     Args:
         repo: Repository used to update the TODO item.
         item_id: Identifier of the TODO item to toggle.
+        clock: Clock used for `updated_at`. Defaults to the system UTC clock.
 
     Returns:
         The updated TODO item, or None if no item exists with the given id.
@@ -99,7 +142,11 @@ def toggle_done(repo: TodoRepository, item_id: int) -> TodoItem | None:
         return None
 
     new_status = Status.DONE if item.status == Status.PENDING else Status.PENDING
-    return repo.set_status(item_id=item_id, status=new_status)
+    return repo.set_status(
+        item_id=item_id,
+        status=new_status,
+        updated_at=(clock or _DEFAULT_CLOCK).now(),
+    )
 
 
 def update_todo(
@@ -110,6 +157,7 @@ def update_todo(
     due_date: date | None,
     priority: Priority | None,
     tags: Sequence[str] | None,
+    clock: Clock | None = None,
 ) -> TodoItem | None:
     """Update an existing TODO item.
 
@@ -121,6 +169,7 @@ def update_todo(
         due_date: New due date or None to clear it.
         priority: New priority or None to clear it.
         tags: New tags sequence or None to clear tags.
+        clock: Clock used for `updated_at`. Defaults to the system UTC clock.
 
     Returns:
         The updated TODO item, or None if the item does not exist.
@@ -134,5 +183,5 @@ def update_todo(
     existing.due_date = due_date
     existing.priority = priority
     existing.tags = [t.strip() for t in (tags or []) if t.strip()]
-    existing.updated_at = datetime.utcnow()
+    existing.updated_at = (clock or _DEFAULT_CLOCK).now()
     return repo.update(existing)
@@ -1,26 +1,131 @@
 from __future__ import annotations
 
-from sqlalchemy import create_engine, inspect, text
-from sqlalchemy.engine import Engine
+import json
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import MetaData, create_engine, event, text
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
+from todo_app.domain.models import Priority, Status
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the `speedups` extra.
+    orjson = None  # type: ignore[assignment]
+
+# Indexes replaced by a newer definition under a different name.
+_SUPERSEDED_INDEXES = ("ix_todos_created_at_desc",)
+
+# Applied to every new SQLite connection: WAL lets readers run alongside the
+# writer and, with synchronous=NORMAL, avoids an fsync on every commit.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=134217728",
+    "PRAGMA cache_size=-20000",
+)
+
 
 class Base(DeclarativeBase):
     """Base class for SQLAlchemy ORM models."""
 
 
+@lru_cache(maxsize=1)
 def get_engine() -> Engine:
     """Create or retrieve the SQLAlchemy engine.
 
+    The engine (and its connection pool) is created once per process and
+    reused by every caller.
+
     Returns:
         A SQLAlchemy engine bound to a local SQLite database file.
     """
     # Local file `todo.db` in project root.
-    return create_engine("sqlite:///todo.db", echo=False, future=True)
+    engine = create_engine(
+        "sqlite:///todo.db",
+        echo=False,
+        future=True,
+        json_serializer=_json_dumps,
+        json_deserializer=_json_loads,
+    )
+    event.listen(engine, "connect", _use_explicit_transactions)
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    event.listen(engine, "begin", _emit_begin)
+    return engine
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize a JSON column value, using orjson when it is installed.
+
+    Args:
+        value: JSON-compatible value to serialize.
+
+    Returns:
+        The JSON text stored in the column.
+    """
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+def _json_loads(raw: str | bytes) -> Any:
+    """Deserialize a JSON column value, using orjson when it is installed.
+
+    Args:
+        raw: JSON text read from the column.
+
+    Returns:
+        The decoded value.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _use_explicit_transactions(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Stop pysqlite from opening and committing transactions on its own.
+
+    By default pysqlite only begins a transaction before DML and runs DDL
+    outside of it. Together with `_emit_begin` this makes every SQLAlchemy
+    transaction, including schema changes, a real SQLite transaction.
+
+    Args:
+        dbapi_connection: Raw DBAPI connection that was just opened.
+        _connection_record: Pool record for the connection (unused).
+    """
+    dbapi_connection.isolation_level = None
+
+
+def _emit_begin(conn: Connection) -> None:
+    """Start the SQLite transaction when SQLAlchemy begins one.
+
+    Args:
+        conn: Connection whose transaction is beginning.
+    """
+    conn.exec_driver_sql("BEGIN")
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Configure a freshly opened SQLite connection for throughput.
+
+    Args:
+        dbapi_connection: Raw DBAPI connection that was just opened.
+        _connection_record: Pool record for the connection (unused).
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
 
 
+@lru_cache(maxsize=1)
 def get_session_factory() -> sessionmaker[Session]:
-    """Return a configured session factory.
+    """Return the configured session factory, created once per process.
 
     Returns:
         A SQLAlchemy sessionmaker bound to the application engine.
@@ -35,34 +140,164 @@ def get_session_factory() -> sessionmaker[Session]:
     )
 
 
-def _run_migrations(engine: Engine) -> None:
+def _run_migrations(conn: Connection) -> set[str] | None:
     """Apply simple in-place migrations for the SQLite schema.
 
-    This is intentionally minimal and only handles adding new nullable
-    columns to the existing `todos` table.
+    This is intentionally minimal: it adds new nullable columns to the
+    existing `todos` table, rewrites legacy comma-joined tags as JSON,
+    converts status / priority names to their integer values and drops
+    indexes whose definition moved to a new name.
+
+    Args:
+        conn: Connection with an open transaction on the application database.
+
+    Returns:
+        Names of the indexes on `todos` after migrating, or None if the table
+        does not exist yet.
     """
-    insp = inspect(engine)
-    if not insp.has_table("todos"):
+    # One PRAGMA gives both the column names and their declared types.
+    column_types = {
+        row[1]: row[2].upper()
+        for row in conn.execute(text("PRAGMA table_info('todos')"))
+    }
+    if not column_types:
         # Table does not exist yet; `create_all` will create it.
+        return None
+
+    # We only ever ADD nullable columns so existing data stays valid.
+    if "due_date" not in column_types:
+        conn.execute(text("ALTER TABLE todos ADD COLUMN due_date DATE"))
+    if "priority" not in column_types:
+        conn.execute(text("ALTER TABLE todos ADD COLUMN priority VARCHAR(20)"))
+    if "tags" not in column_types:
+        conn.execute(text("ALTER TABLE todos ADD COLUMN tags JSON"))
+    elif "CHAR" in column_types["tags"]:
+        # Only the legacy VARCHAR column can hold comma-joined tags; checking
+        # the declared type avoids scanning the table on every start.
+        _convert_legacy_tags(conn)
+    if "CHAR" in column_types["status"]:
+        _rebuild_with_integer_enums(conn)
+
+    index_names = {row[1] for row in conn.execute(text("PRAGMA index_list('todos')"))}
+    for name in _SUPERSEDED_INDEXES:
+        if name in index_names:
+            conn.execute(text(f"DROP INDEX {name}"))
+            index_names.discard(name)
+    return index_names
+
+
+def _convert_legacy_tags(conn: Connection) -> None:
+    """Rewrite comma-joined tag strings as JSON arrays.
+
+    Args:
+        conn: Connection with an open transaction on the application database.
+    """
+    rows = conn.execute(
+        text(
+            "SELECT id, tags FROM todos WHERE tags IS NOT NULL AND CASE "
+            "WHEN json_valid(tags) THEN json_type(tags) <> 'array' ELSE 1 END"
+        )
+    ).all()
+    if not rows:
         return
 
-    existing_cols = {col["name"] for col in insp.get_columns("todos")}
+    params = [
+        {
+            "id": row_id,
+            "tags": json.dumps([t.strip() for t in raw.split(",") if t.strip()]),
+        }
+        for row_id, raw in rows
+    ]
+    conn.execute(text("UPDATE todos SET tags = :tags WHERE id = :id"), params)
 
-    # We only ever ADD nullable columns so existing data stays valid.
-    with engine.begin() as conn:
-        if "due_date" not in existing_cols:
-            conn.execute(text("ALTER TABLE todos ADD COLUMN due_date DATE"))
-        if "priority" not in existing_cols:
-            conn.execute(text("ALTER TABLE todos ADD COLUMN priority VARCHAR(20)"))
-        if "tags" not in existing_cols:
-            conn.execute(text("ALTER TABLE todos ADD COLUMN tags VARCHAR(255)"))
+
+def _rebuild_with_integer_enums(conn: Connection) -> None:
+    """Recreate `todos` with integer status / priority columns.
+
+    SQLite cannot change a column's type in place, so the current schema is
+    created under a staging name, the rows are copied over with enum names
+    mapped to their values, and only then is the legacy table replaced.
+
+    Args:
+        conn: Connection with an open transaction on the application database.
+
+    Raises:
+        ValueError: If a row holds a status or priority name that has no
+            enum member. The table is left untouched in that case.
+    """
+    from . import models as orm_models  # noqa: F401
+
+    _check_legacy_enum_names(conn, "status", Status)
+    _check_legacy_enum_names(conn, "priority", Priority)
+
+    table = Base.metadata.tables["todos"]
+    # Index names must be free before the staging table creates them.
+    for index in table.indexes:
+        conn.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+    staging = table.to_metadata(MetaData(), name="todos_new")
+    staging.create(bind=conn)
+
+    status_case = " ".join(f"WHEN '{m.name}' THEN {m.value}" for m in Status)
+    priority_case = " ".join(f"WHEN '{m.name}' THEN {m.value}" for m in Priority)
+    conn.execute(
+        text(
+            "INSERT INTO todos_new (id, title, description, status, created_at, "
+            "updated_at, due_date, priority, tags) "
+            f"SELECT id, title, description, CASE status {status_case} END, "
+            "created_at, updated_at, due_date, "
+            f"CASE priority {priority_case} END, tags FROM todos"
+        )
+    )
+    conn.execute(text("DROP TABLE todos"))
+    conn.execute(text("ALTER TABLE todos_new RENAME TO todos"))
+
+
+def _check_legacy_enum_names(
+    conn: Connection, column: str, enum_cls: type[Status] | type[Priority]
+) -> None:
+    """Fail if a legacy enum column holds a name that cannot be mapped.
+
+    Args:
+        conn: Connection with an open transaction on the application database.
+        column: Name of the legacy VARCHAR enum column.
+        enum_cls: Enum whose member names the column may hold.
+
+    Raises:
+        ValueError: If the column holds names outside of `enum_cls`.
+    """
+    known = ", ".join(f"'{m.name}'" for m in enum_cls)
+    unknown = (
+        conn.execute(
+            text(
+                f"SELECT DISTINCT {column} FROM todos "
+                f"WHERE {column} IS NOT NULL AND {column} NOT IN ({known})"
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if unknown:
+        msg = f"Cannot migrate unknown {column} values: {', '.join(unknown)}"
+        raise ValueError(msg)
 
 
 def init_db() -> None:
-    """Initialize the database schema and run lightweight migrations."""
+    """Initialize the database schema and run lightweight migrations.
+
+    Migrations, table creation and the index pass run in one transaction,
+    so a failing migration leaves the database as it was.
+    """
     # Import ORM models so metadata is populated.
     from . import models as orm_models  # noqa: F401
 
-    engine = get_engine()
-    _run_migrations(engine)
-    Base.metadata.create_all(bind=engine)
+    with get_engine().begin() as conn:
+        index_names = _run_migrations(conn)
+        if index_names is None:
+            Base.metadata.create_all(bind=conn)
+            return
+
+        # The table already exists, so only create indexes that were added
+        # after it was first created; the migrations already listed them.
+        for index in Base.metadata.tables["todos"].indexes:
+            if index.name not in index_names:
+                index.create(bind=conn)
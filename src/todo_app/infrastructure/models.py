@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
-from sqlalchemy import Date, DateTime, Integer, String
+from sqlalchemy import JSON, Date, DateTime, Index, Integer, SmallInteger, String
 from sqlalchemy.orm import Mapped, mapped_column
 
+from todo_app.domain.models import Status
+
 from .db import Base
 
 
@@ -16,7 +18,9 @@ class TodoORM(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(String(2000), nullable=True)
-    status: Mapped[str] = mapped_column(String(20), nullable=False, default="PENDING")
+    status: Mapped[int] = mapped_column(
+        SmallInteger, nullable=False, default=Status.PENDING.value
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=False), nullable=False
     )
@@ -25,5 +29,15 @@ class TodoORM(Base):
     )
 
     due_date: Mapped[date | None] = mapped_column(Date, nullable=True)
-    priority: Mapped[str | None] = mapped_column(String(20), nullable=True)
-    tags: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    priority: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
+    tags: Mapped[list[str] | None] = mapped_column(
+        JSON(none_as_null=True), nullable=True
+    )
+
+    __table_args__ = (
+        # Serves the combined status / priority / due-date filter in `list_all`.
+        Index("ix_todos_status_priority_due", "status", "priority", "due_date"),
+        # Matches the (created_at, id) keyset order of `list_all`, so pages
+        # are read straight from the index without a sort.
+        Index("ix_todos_created_at_id_desc", created_at.desc(), id.desc()),
+    )
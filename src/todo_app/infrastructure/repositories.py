@@ -1,100 +1,370 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
-from datetime import datetime
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import replace
+from datetime import date, datetime
+from typing import Any, cast
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select, tuple_, update
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql import ColumnElement
 
-from todo_app.domain.models import Priority, Status, TodoItem
+from todo_app.domain.models import Priority, Status, TodoItem, TodoSummary
 from todo_app.domain.repositories import TodoRepository
 
 from .models import TodoORM
 
+# Enum members indexed by their stored value. Values are assigned with
+# `auto()` and start at 1, so slot 0 is an unused placeholder.
+_STATUS_BY_VALUE = cast(tuple[Status, ...], (None, *Status))
+_PRIORITY_BY_VALUE = cast(tuple[Priority, ...], (None, *Priority))
+
+# Maximum number of distinct filter combinations kept by the list cache.
+_LIST_CACHE_SIZE = 32
+
+# Rows fetched per round trip when streaming items with `iter_all`.
+_ITER_BATCH_SIZE = 500
+
+_ListKey = tuple[Status | None, Priority | None, date | None, int | None, int | None]
+
 
 class SqlAlchemyTodoRepository(TodoRepository):
-    """SQLAlchemy-backed implementation of the TodoRepository protocol."""
+    """SQLAlchemy-backed implementation of the TodoRepository protocol.
+
+    Results of `list_all` are cached per filter combination and dropped on
+    every write made through the repository, so the cache assumes this
+    repository is the only writer to the database. Callers get copies of the
+    cached items, so mutating a result does not affect later listings.
+
+    A unit of work is tracked per thread, so one instance can be shared by
+    concurrent callers that each run their own unit of work.
+    """
 
-    def __init__(self, session_factory: sessionmaker[Session]) -> None:
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session] | None = None,
+        session: Session | None = None,
+    ) -> None:
         """Initialize the repository.
 
         Args:
             session_factory: Factory used to create new SQLAlchemy sessions.
+                Each operation runs in its own session and transaction.
+            session: Externally managed session. When given, every operation
+                runs in this session and the caller is responsible for
+                committing it.
+
+        Raises:
+            ValueError: If neither a session factory nor a session is given.
         """
+        if session_factory is None and session is None:
+            msg = "Either a session_factory or a session must be provided"
+            raise ValueError(msg)
         self._session_factory = session_factory
+        self._bound_session = session
+        self._local = threading.local()
+        self._list_cache: dict[_ListKey, tuple[TodoItem, ...]] = {}
+        self._version = 0
+
+    @property
+    def _active_session(self) -> Session | None:
+        """Session of the current thread's unit of work, or the bound session."""
+        return getattr(self._local, "session", None) or self._bound_session
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        """Run all repository operations inside the block in one transaction.
+
+        The transaction is committed once when the block exits and rolled
+        back if it raises an exception. Other interruptions, such as a
+        `BaseException` used for control flow, keep the operations that
+        completed, as they would be kept without a unit of work. Nested
+        calls, or calls on a repository bound to an external session, join
+        the surrounding transaction.
+        """
+        if self._active_session is not None:
+            yield
+            return
+
+        with self._new_session() as session:
+            self._local.session = session
+            try:
+                yield
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                self._local.session = None
+                try:
+                    if session.in_transaction():
+                        session.commit()
+                finally:
+                    self._invalidate()
+
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        """Yield the session an operation should run in.
+
+        Inside a unit of work the shared session is yielded and left open;
+        otherwise a new session is opened and committed on success.
+        """
+        if self._active_session is not None:
+            yield self._active_session
+            return
+
+        with self._new_session() as session:
+            yield session
+            session.commit()
+
+    @contextmanager
+    def _write_session(self) -> Iterator[Session]:
+        """Like `_session`, but drops cached list results once the write ends."""
+        try:
+            with self._session() as session:
+                yield session
+        finally:
+            self._invalidate()
+
+    def _new_session(self) -> Session:
+        """Open a new session from the configured session factory."""
+        if self._session_factory is None:
+            msg = "Repository is bound to an external session"
+            raise RuntimeError(msg)
+        return self._session_factory()
 
     def add(self, item: TodoItem) -> TodoItem:
         """Persist a new TODO item and return it with an assigned id."""
-        with self._session_factory() as session:
-            orm = TodoORM(
-                title=item.title,
-                description=item.description,
-                status=item.status.name,
-                created_at=item.created_at,
-                updated_at=item.updated_at,
-                due_date=item.due_date,
-                priority=item.priority.name if item.priority is not None else None,
-                tags=",".join(item.tags) if item.tags else None,
-            )
+        with self._write_session() as session:
+            orm = TodoORM(**self._to_row(item))
             session.add(orm)
-            session.commit()
-            session.refresh(orm)
+            session.flush()
             return self._to_domain(orm)
 
-    def list_all(self) -> Sequence[TodoItem]:
-        """Return all TODO items."""
-        with self._session_factory() as session:
-            stmt = select(TodoORM).order_by(TodoORM.created_at.desc())
+    def bulk_add(self, items: Sequence[TodoItem]) -> list[TodoItem]:
+        """Persist several new TODO items in one statement and one transaction.
+
+        Returns:
+            Copies of the given items with their assigned ids, in input order.
+        """
+        if not items:
+            return []
+
+        stmt = insert(TodoORM).returning(TodoORM.id, sort_by_parameter_order=True)
+        rows = [self._to_row(item) for item in items]
+        with self._write_session() as session:
+            ids = session.scalars(stmt, rows).all()
+        return [
+            replace(item, id=item_id) for item, item_id in zip(items, ids, strict=True)
+        ]
+
+    def list_all(
+        self,
+        status: Status | None = None,
+        priority: Priority | None = None,
+        due_on_or_before: date | None = None,
+        limit: int | None = None,
+        after_id: int | None = None,
+    ) -> Sequence[TodoItem]:
+        """Return TODO items matching the given filters, newest first.
+
+        Filters are applied in SQL so only matching rows are loaded and
+        converted to domain entities. Pages are addressed by keyset rather
+        than OFFSET, so later pages cost the same as the first. Results are
+        served from the list cache when no write happened since they were
+        loaded.
+
+        Raises:
+            ValueError: If `after_id` does not match an existing item.
+        """
+        # Reads inside a session that may still roll back bypass the cache.
+        cacheable = self._active_session is None
+        key: _ListKey = (status, priority, due_on_or_before, limit, after_id)
+        cached = self._list_cache.get(key) if cacheable else None
+        if cached is not None:
+            return self._copy_items(cached)
+
+        stmt = select(TodoORM).where(
+            *_filter_criteria(status, priority, due_on_or_before)
+        )
+        if after_id is not None:
+            cursor_created_at = (
+                select(TodoORM.created_at)
+                .where(TodoORM.id == after_id)
+                .scalar_subquery()
+            )
+            stmt = stmt.where(
+                tuple_(TodoORM.created_at, TodoORM.id)
+                < tuple_(cursor_created_at, after_id)
+            )
+        stmt = stmt.order_by(TodoORM.created_at.desc(), TodoORM.id.desc())
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        # Results that raced with a write are not cached.
+        version = self._version
+        with self._session() as session:
             result = session.scalars(stmt).all()
-            return [self._to_domain(row) for row in result]
+            # A deleted cursor row makes the keyset comparison NULL, which
+            # would look like the last page. Only empty pages need the check.
+            if not result and after_id is not None:
+                if session.get(TodoORM, after_id) is None:
+                    msg = f"Todo with id {after_id} not found"
+                    raise ValueError(msg)
+            items = tuple(self._to_domain(row) for row in result)
+
+        if cacheable and version == self._version:
+            self._store_list(key, items)
+            return self._copy_items(items)
+        return items
+
+    def list_summaries(
+        self,
+        status: Status | None = None,
+        priority: Priority | None = None,
+        due_on_or_before: date | None = None,
+    ) -> Sequence[TodoSummary]:
+        """Return summaries of matching TODO items, newest first.
+
+        Only the summary columns are selected and returned as plain rows, so
+        no ORM entities or full domain items are built.
+        """
+        stmt = (
+            select(TodoORM.id, TodoORM.title, TodoORM.status, TodoORM.due_date)
+            .where(*_filter_criteria(status, priority, due_on_or_before))
+            .order_by(TodoORM.created_at.desc(), TodoORM.id.desc())
+        )
+        with self._session() as session:
+            return [
+                TodoSummary(row_id, title, _STATUS_BY_VALUE[status_value], due_date)
+                for row_id, title, status_value, due_date in session.execute(stmt)
+            ]
+
+    def iter_all(self) -> Iterator[TodoItem]:
+        """Yield all TODO items, newest first, fetching rows in batches.
+
+        Only one batch of rows is held in memory at a time; the session stays
+        open until the iterator is exhausted or closed.
+        """
+        stmt = (
+            select(TodoORM)
+            .order_by(TodoORM.created_at.desc(), TodoORM.id.desc())
+            .execution_options(yield_per=_ITER_BATCH_SIZE)
+        )
+        with self._session() as session:
+            for row in session.scalars(stmt):
+                yield self._to_domain(row)
 
     def get(self, item_id: int) -> TodoItem | None:
         """Retrieve a TODO item by its id."""
-        with self._session_factory() as session:
+        with self._session() as session:
             orm = session.get(TodoORM, item_id)
             if orm is None:
                 return None
             return self._to_domain(orm)
 
     def update(self, item: TodoItem) -> TodoItem:
-        """Update an existing TODO item."""
-        with self._session_factory() as session:
-            orm = session.get(TodoORM, item.id)
+        """Update an existing TODO item.
+
+        The row is written and read back in a single UPDATE ... RETURNING
+        statement.
+
+        Raises:
+            ValueError: If no TODO item exists with the item's id.
+        """
+        stmt = (
+            update(TodoORM)
+            .where(TodoORM.id == item.id)
+            .values(
+                title=item.title,
+                description=item.description,
+                status=item.status.value,
+                updated_at=item.updated_at,
+                due_date=item.due_date,
+                priority=item.priority.value if item.priority is not None else None,
+                tags=item.tags or None,
+            )
+            .returning(TodoORM)
+        )
+        with self._write_session() as session:
+            orm = session.scalars(stmt).one_or_none()
             if orm is None:
                 msg = f"Todo with id {item.id} not found"
                 raise ValueError(msg)
-            orm.title = item.title
-            orm.description = item.description
-            orm.status = item.status.name
-            orm.updated_at = datetime.utcnow()
-            orm.due_date = item.due_date
-            orm.priority = item.priority.name if item.priority is not None else None
-            orm.tags = ",".join(item.tags) if item.tags else None
-            session.commit()
-            session.refresh(orm)
             return self._to_domain(orm)
 
     def delete(self, item_id: int) -> None:
         """Delete a TODO item by its id."""
-        with self._session_factory() as session:
-            orm = session.get(TodoORM, item_id)
-            if orm is None:
-                return
-            session.delete(orm)
-            session.commit()
+        with self._write_session() as session:
+            session.execute(delete(TodoORM).where(TodoORM.id == item_id))
 
-    def set_status(self, item_id: int, status: Status) -> TodoItem | None:
-        """Set the status of a TODO item and return the updated item."""
-        with self._session_factory() as session:
-            orm = session.get(TodoORM, item_id)
+    def set_status(
+        self,
+        item_id: int,
+        status: Status,
+        *,
+        updated_at: datetime | None = None,
+    ) -> TodoItem | None:
+        """Set the status of a TODO item and return the updated item.
+
+        The row is written and read back in a single UPDATE ... RETURNING
+        statement. `updated_at` defaults to the current UTC time.
+        """
+        stmt = (
+            update(TodoORM)
+            .where(TodoORM.id == item_id)
+            .values(
+                status=status.value,
+                updated_at=updated_at or datetime.utcnow(),
+            )
+            .returning(TodoORM)
+        )
+        with self._write_session() as session:
+            orm = session.scalars(stmt).one_or_none()
             if orm is None:
                 return None
-            orm.status = status.name
-            orm.updated_at = datetime.utcnow()
-            session.commit()
-            session.refresh(orm)
             return self._to_domain(orm)
 
+    def _invalidate(self) -> None:
+        """Drop cached list results after a write."""
+        self._version += 1
+        self._list_cache.clear()
+
+    def _store_list(self, key: _ListKey, items: tuple[TodoItem, ...]) -> None:
+        """Cache a list result, evicting the oldest entry when full."""
+        if len(self._list_cache) >= _LIST_CACHE_SIZE:
+            oldest = next(iter(self._list_cache), None)
+            if oldest is not None:
+                self._list_cache.pop(oldest, None)
+        self._list_cache[key] = items
+
+    @staticmethod
+    def _copy_items(items: tuple[TodoItem, ...]) -> tuple[TodoItem, ...]:
+        """Copy cached items so callers cannot change the cached entries."""
+        return tuple(replace(item, tags=list(item.tags)) for item in items)
+
+    @staticmethod
+    def _to_row(item: TodoItem) -> dict[str, Any]:
+        """Map a new domain entity to ORM column values.
+
+        Args:
+            item: Domain-level TodoItem to persist.
+
+        Returns:
+            Column values keyed by ORM attribute name, without the id.
+        """
+        return {
+            "title": item.title,
+            "description": item.description,
+            "status": item.status.value,
+            "created_at": item.created_at,
+            "updated_at": item.updated_at,
+            "due_date": item.due_date,
+            "priority": item.priority.value if item.priority is not None else None,
+            "tags": item.tags or None,
+        }
+
     @staticmethod
     def _to_domain(orm: TodoORM) -> TodoItem:
         """Map ORM model to domain entity.
@@ -105,22 +375,42 @@ class SqlAlchemyTodoRepository(TodoRepository):
         Returns:
             Domain-level TodoItem.
         """
-        tags_list = []
-        if orm.tags:
-            tags_list = [t.strip() for t in orm.tags.split(",") if t.strip()]
-
-        priority_enum: Priority | None = None
-        if orm.priority:
-            priority_enum = Priority[orm.priority]
+        tags_list = orm.tags or []
+        priority_enum = _PRIORITY_BY_VALUE[orm.priority] if orm.priority else None
 
         return TodoItem(
             id=orm.id,
             title=orm.title,
             description=orm.description,
-            status=Status[orm.status],
+            status=_STATUS_BY_VALUE[orm.status],
             created_at=orm.created_at,
             updated_at=orm.updated_at,
             due_date=orm.due_date,
             priority=priority_enum,
             tags=tags_list,
         )
+
+
+def _filter_criteria(
+    status: Status | None,
+    priority: Priority | None,
+    due_on_or_before: date | None,
+) -> list[ColumnElement[bool]]:
+    """Build the WHERE criteria for the enabled list filters.
+
+    Args:
+        status: Optional status to filter by.
+        priority: Optional priority to filter by.
+        due_on_or_before: Optional inclusive upper bound on the due date.
+
+    Returns:
+        The criteria to pass to `Select.where`; empty if no filter is set.
+    """
+    criteria: list[ColumnElement[bool]] = []
+    if status is not None:
+        criteria.append(TodoORM.status == status.value)
+    if priority is not None:
+        criteria.append(TodoORM.priority == priority.value)
+    if due_on_or_before is not None:
+        criteria.append(TodoORM.due_date <= due_on_or_before)
+    return criteria
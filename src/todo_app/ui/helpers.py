@@ -1,25 +1,39 @@
 from __future__ import annotations
 
-from todo_app.domain.models import Priority
+import re
+from collections.abc import Mapping
+from types import MappingProxyType
 
+from todo_app.domain.models import Priority
 
-def priority_label_to_enum(label: str) -> Priority | None:
-    """Convert a human-friendly priority label to a Priority enum."""
-    mapping = {
+# Built once at import time rather than on every UI event, and read-only so
+# callers cannot alter the shared tables.
+_PRIORITY_LABEL_MAP: Mapping[str, Priority] = MappingProxyType(
+    {
         "Low": Priority.LOW,
         "Medium": Priority.MEDIUM,
         "High": Priority.HIGH,
     }
-    return mapping.get(label)
+)
+_LABEL_BY_PRIORITY: Mapping[Priority, str] = MappingProxyType(
+    {priority: label for label, priority in _PRIORITY_LABEL_MAP.items()}
+)
+
+# A tag: runs from its first to its last non-space character, never crossing
+# a comma, so surrounding whitespace and empty entries are skipped.
+_TAG_RE = re.compile(r"[^\s,](?:[^,]*[^\s,])?")
+
+
+def priority_label_to_enum(label: str) -> Priority | None:
+    """Convert a human-friendly priority label to a Priority enum."""
+    return _PRIORITY_LABEL_MAP.get(label)
 
 
 def priority_enum_to_label(priority: Priority | None) -> str:
     """Convert a Priority enum to a readable UI label."""
-    if priority is None:
-        return "None"
-    return priority.name.capitalize()
+    return "None" if priority is None else _LABEL_BY_PRIORITY[priority]
 
 
 def parse_tags(raw: str) -> list[str]:
     """Convert comma-separated tag text into a clean list."""
-    return [t.strip() for t in raw.split(",") if t.strip()]
+    return _TAG_RE.findall(raw)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import date
+from html import escape
 
 import streamlit as st
 
@@ -14,17 +15,58 @@ from todo_app.ui.helpers import (
     priority_label_to_enum,
 )
 
+# Selectbox options, built once instead of on every rerun.
+_CREATE_PRIORITY_OPTIONS = ("Medium", "Low", "High")
+_STATUS_FILTER_OPTIONS = ("All", "Pending", "Done")
+_PRIORITY_FILTER_OPTIONS = ("All", "Low", "Medium", "High")
+_EDIT_PRIORITY_OPTIONS = ("None", "Low", "Medium", "High")
+_EDIT_PRIORITY_INDEX = {label: idx for idx, label in enumerate(_EDIT_PRIORITY_OPTIONS)}
 
+# Markdown templates for a row's title, picked by status.
+_ROW_TITLE_DONE = "**~~{}~~**"
+_ROW_TITLE_PENDING = "**{}**"
+
+
+@st.cache_resource
 def get_repo() -> SqlAlchemyTodoRepository:
-    """Retrieve a singleton repository instance stored in Streamlit session state.
+    """Retrieve the repository shared by every session of this Streamlit process.
 
     Returns:
         A SqlAlchemyTodoRepository instance.
     """
-    if "todo_repo" not in st.session_state:
-        session_factory = get_session_factory()
-        st.session_state["todo_repo"] = SqlAlchemyTodoRepository(session_factory)
-    return st.session_state["todo_repo"]
+    return SqlAlchemyTodoRepository(get_session_factory())
+
+
+@st.cache_data(show_spinner=False)
+def _cached_todo_list(
+    status_filter: Status | None,
+    priority_filter: Priority | None,
+    due_today_or_overdue: bool,
+    reference_date: date,
+) -> list[TodoItem]:
+    """Fetch filtered TODO items, cached across reruns per filter combination.
+
+    The reference date is part of the cache key so the due-date filter
+    follows the calendar. Call `_cached_todo_list.clear()` after any write.
+
+    Args:
+        status_filter: Optional status filter.
+        priority_filter: Optional priority filter.
+        due_today_or_overdue: Whether to restrict to items due today or overdue.
+        reference_date: Date used for the due-date comparison.
+
+    Returns:
+        The matching TODO items.
+    """
+    return list(
+        list_todos(
+            repo=get_repo(),
+            status=status_filter,
+            priority=priority_filter,
+            due_today_or_overdue=due_today_or_overdue,
+            reference_date=reference_date,
+        )
+    )
 
 
 def render_create_form() -> None:
@@ -41,7 +83,7 @@ def render_create_form() -> None:
 
         priority_label: str = st.selectbox(
             "Priority",
-            options=["Medium", "Low", "High"],
+            options=_CREATE_PRIORITY_OPTIONS,
             index=0,
         )
         priority = priority_label_to_enum(priority_label)
@@ -54,14 +96,18 @@ def render_create_form() -> None:
                 st.warning("Title is required.")
             else:
                 repo = get_repo()
-                create_todo(
-                    repo=repo,
-                    title=title,
-                    description=description,
-                    due_date=due_date_value,
-                    priority=priority,
-                    tags=parse_tags(tags_raw),
-                )
+                with repo.unit_of_work():
+                    create_todo(
+                        repo=repo,
+                        title=title,
+                        description=description,
+                        due_date=due_date_value,
+                        priority=priority,
+                        tags=parse_tags(tags_raw),
+                    )
+                # Cleared once the write is committed, so no other session
+                # can cache the rows from before it.
+                _cached_todo_list.clear()
                 st.success("TODO created.")
 
 
@@ -77,7 +123,7 @@ def render_filters() -> tuple[Status | None, Priority | None, bool]:
     with cols[0]:
         status_option = st.selectbox(
             "Status",
-            options=["All", "Pending", "Done"],
+            options=_STATUS_FILTER_OPTIONS,
             index=0,
         )
         status_filter: Status | None
@@ -91,7 +137,7 @@ def render_filters() -> tuple[Status | None, Priority | None, bool]:
     with cols[1]:
         priority_option = st.selectbox(
             "Priority",
-            options=["All", "Low", "Medium", "High"],
+            options=_PRIORITY_FILTER_OPTIONS,
             index=0,
         )
         priority_filter: Priority | None
@@ -120,12 +166,11 @@ def render_todo_list(
     """
     st.subheader("TODOs")
 
-    repo = get_repo()
-    items = list_todos(
-        repo=repo,
-        status=status_filter,
-        priority=priority_filter,
+    items = _cached_todo_list(
+        status_filter=status_filter,
+        priority_filter=priority_filter,
         due_today_or_overdue=due_today_or_overdue,
+        reference_date=date.today(),
     )
 
     if not items:
@@ -144,65 +189,62 @@ def _on_toggle(item_id: int) -> None:
     """
     repo = get_repo()
     toggle_done(repo=repo, item_id=item_id)
+    _cached_todo_list.clear()
 
 
 def _render_edit_form(item: TodoItem) -> None:
-    """Render an inline edit form for a TODO item.
+    """Render the inline edit form for a TODO item.
 
     Args:
         item: TODO item to edit.
     """
-    with st.expander("Edit", expanded=False):
-        with st.form(f"edit_form_{item.id}"):
-            title: str = st.text_input("Title", value=item.title)
-            description: str = st.text_area(
-                "Description",
-                value=item.description or "",
-            )
-
-            has_due = st.checkbox(
-                "Set due date?",
-                value=item.due_date is not None,
-                key=f"edit_due_checkbox_{item.id}",
-            )
-
-            # Always render the date input; use its value only if has_due is True
-            raw_due_date: date = st.date_input(
-                "Due date",
-                value=item.due_date or date.today(),
-                key=f"edit_due_date_{item.id}",
-            )
-            due_date_value: date | None = raw_due_date if has_due else None
-
-            priority_label = st.selectbox(
-                "Priority",
-                options=["None", "Low", "Medium", "High"],
-                index=[
-                    "None",
-                    "Low",
-                    "Medium",
-                    "High",
-                ].index(priority_enum_to_label(item.priority)),
-                key=f"edit_priority_{item.id}",
-            )
-            priority: Priority | None
-            if priority_label == "None":
-                priority = None
+    with st.form(f"edit_form_{item.id}"):
+        title: str = st.text_input("Title", value=item.title)
+        description: str = st.text_area(
+            "Description",
+            value=item.description or "",
+        )
+
+        has_due = st.checkbox(
+            "Set due date?",
+            value=item.due_date is not None,
+            key=f"edit_due_checkbox_{item.id}",
+        )
+
+        # Always render the date input; use its value only if has_due is True
+        raw_due_date: date = st.date_input(
+            "Due date",
+            value=item.due_date or date.today(),
+            key=f"edit_due_date_{item.id}",
+        )
+        due_date_value: date | None = raw_due_date if has_due else None
+
+        priority_label = st.selectbox(
+            "Priority",
+            options=_EDIT_PRIORITY_OPTIONS,
+            index=_EDIT_PRIORITY_INDEX[priority_enum_to_label(item.priority)],
+            key=f"edit_priority_{item.id}",
+        )
+        priority: Priority | None
+        if priority_label == "None":
+            priority = None
+        else:
+            priority = priority_label_to_enum(priority_label)
+
+        tags_raw = st.text_input(
+            "Tags (comma separated)",
+            value=",".join(item.tags),
+            key=f"edit_tags_{item.id}",
+        )
+
+        submitted = st.form_submit_button("Save")
+        if submitted:
+            if not title.strip():
+                st.warning("Title is required.")
             else:
-                priority = priority_label_to_enum(priority_label)
-
-            tags_raw = st.text_input(
-                "Tags (comma separated)",
-                value=",".join(item.tags),
-                key=f"edit_tags_{item.id}",
-            )
-
-            submitted = st.form_submit_button("Save")
-            if submitted:
-                if not title.strip():
-                    st.warning("Title is required.")
-                else:
-                    repo = get_repo()
+                repo = get_repo()
+                # The read and the write of the save share one transaction.
+                with repo.unit_of_work():
                     updated = update_todo(
                         repo=repo,
                         item_id=item.id or 0,
@@ -212,10 +254,11 @@ def _render_edit_form(item: TodoItem) -> None:
                         priority=priority,
                         tags=parse_tags(tags_raw),
                     )
-                    if updated is not None:
-                        st.success("TODO updated.")
-                    else:
-                        st.error("TODO not found. It may have been deleted.")
+                _cached_todo_list.clear()
+                if updated is not None:
+                    st.success("TODO updated.")
+                else:
+                    st.error("TODO not found. It may have been deleted.")
 
 
 def _render_todo_row(item: TodoItem) -> None:
@@ -236,10 +279,13 @@ def _render_todo_row(item: TodoItem) -> None:
         )
 
     with cols[1]:
-        title_text = item.title
-        if item.status == Status.DONE:
-            title_text = f"~~{title_text}~~"
-        st.markdown(f"**{title_text}**")
+        # Title, metadata and description go out as a single Markdown element
+        # to keep the number of elements sent per row down. User text is
+        # HTML-escaped because the metadata line needs raw HTML.
+        title_tmpl = (
+            _ROW_TITLE_DONE if item.status is Status.DONE else _ROW_TITLE_PENDING
+        )
+        body_parts = [title_tmpl.format(escape(item.title))]
 
         meta_parts: list[str] = []
         if item.due_date:
@@ -247,15 +293,19 @@ def _render_todo_row(item: TodoItem) -> None:
         if item.priority:
             meta_parts.append(f"Priority: {priority_enum_to_label(item.priority)}")
         if item.tags:
-            meta_parts.append(f"Tags: {', '.join(item.tags)}")
+            meta_parts.append(f"Tags: {escape(', '.join(item.tags))}")
 
         if meta_parts:
-            st.caption(" | ".join(meta_parts))
+            body_parts.append(f"<small>{' | '.join(meta_parts)}</small>")
 
         if item.description:
-            st.write(item.description)
+            body_parts.append(f"\n{escape(item.description)}")
+
+        st.markdown("  \n".join(body_parts), unsafe_allow_html=True)
 
-        _render_edit_form(item)
+        # The form's widgets are only built while the user has it open.
+        if st.toggle("Edit", value=False, key=f"edit_toggle_{item.id}"):
+            _render_edit_form(item)
 
 
 def main() -> None:
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from todo_app.domain.models import Priority, Status, TodoItem
+from todo_app.infrastructure import db
+from todo_app.infrastructure.db import (
+    Base,
+    _emit_begin,
+    _json_dumps,
+    _json_loads,
+    _run_migrations,
+    _set_sqlite_pragmas,
+    _use_explicit_transactions,
+)
+from todo_app.infrastructure.repositories import SqlAlchemyTodoRepository
+
+
+def _create_legacy_table(engine: Engine, values: str) -> None:
+    """Create a `todos` table in its legacy string-enum layout and fill it."""
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE todos ("
+                "id INTEGER PRIMARY KEY, title VARCHAR(255) NOT NULL, "
+                "description VARCHAR(2000), status VARCHAR(20) NOT NULL, "
+                "created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL, "
+                "due_date DATE, priority VARCHAR(20), tags VARCHAR(255))"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO todos "
+                "(title, status, created_at, updated_at, priority, tags) "
+                f"VALUES {values}"
+            )
+        )
+
+
+def test_legacy_table_is_migrated(tmp_path: Path) -> None:
+    """Migrating a legacy table should convert tags and enum columns."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}", future=True)
+    _create_legacy_table(
+        engine,
+        "('tagged', 'PENDING', '2025-01-01 00:00:00', "
+        "'2025-01-01 00:00:00', 'HIGH', 'work, home'), "
+        "('untagged', 'DONE', '2025-01-01 00:00:00', "
+        "'2025-01-01 00:00:00', NULL, NULL)",
+    )
+
+    with engine.begin() as conn:
+        _run_migrations(conn)
+        Base.metadata.create_all(bind=conn)
+
+    repo = SqlAlchemyTodoRepository(sessionmaker(bind=engine, class_=Session))
+    items = {item.title: item for item in repo.list_all()}
+    assert items["tagged"].tags == ["work", "home"]
+    assert items["tagged"].status == Status.PENDING
+    assert items["tagged"].priority == Priority.HIGH
+    assert items["untagged"].tags == []
+    assert items["untagged"].status == Status.DONE
+    assert items["untagged"].priority is None
+
+    done = repo.list_all(status=Status.DONE)
+    assert [item.title for item in done] == ["untagged"]
+
+
+def test_legacy_table_with_unknown_status_is_left_untouched(
+    tmp_path: Path,
+) -> None:
+    """Unmappable enum names should fail the migration before any change."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}", future=True)
+    _create_legacy_table(
+        engine,
+        "('archived', 'ARCHIVED', '2025-01-01 00:00:00', "
+        "'2025-01-01 00:00:00', NULL, NULL)",
+    )
+
+    with pytest.raises(ValueError, match="ARCHIVED"), engine.begin() as conn:
+        _run_migrations(conn)
+
+    assert inspect(engine).get_table_names() == ["todos"]
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT title, status FROM todos")).all()
+    assert [tuple(row) for row in rows] == [("archived", "ARCHIVED")]
+
+
+def test_schema_changes_roll_back_with_the_transaction(tmp_path: Path) -> None:
+    """DDL should be undone when the surrounding transaction fails."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'ddl.db'}", future=True)
+    event.listen(engine, "connect", _use_explicit_transactions)
+    event.listen(engine, "begin", _emit_begin)
+    _create_legacy_table(
+        engine,
+        "('kept', 'PENDING', '2025-01-01 00:00:00', "
+        "'2025-01-01 00:00:00', NULL, NULL)",
+    )
+
+    with pytest.raises(RuntimeError), engine.begin() as conn:
+        _run_migrations(conn)
+        raise RuntimeError("boom")
+
+    columns = {col["name"]: col for col in inspect(engine).get_columns("todos")}
+    assert "CHAR" in str(columns["status"]["type"])
+    assert inspect(engine).get_table_names() == ["todos"]
+
+
+def test_init_db_only_inspects_an_up_to_date_schema(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Re-running init_db should cost two PRAGMAs and create missing indexes."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'init.db'}", future=True)
+    event.listen(engine, "connect", _use_explicit_transactions)
+    event.listen(engine, "begin", _emit_begin)
+    monkeypatch.setattr(db, "get_engine", lambda: engine)
+
+    db.init_db()
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_todos_status_priority_due"))
+
+    statements: list[str] = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda _conn, _cursor, statement, *_args: statements.append(statement),
+    )
+    db.init_db()
+    assert len([s for s in statements if s != "BEGIN"]) == 3
+    assert "ix_todos_status_priority_due" in {
+        index["name"] for index in inspect(engine).get_indexes("todos")
+    }
+
+    statements.clear()
+    db.init_db()
+    assert [s for s in statements if s != "BEGIN"] == [
+        "PRAGMA table_info('todos')",
+        "PRAGMA index_list('todos')",
+    ]
+
+
+def test_sqlite_pragmas_are_applied_on_connect(tmp_path: Path) -> None:
+    """New connections should run in WAL mode with relaxed syncing."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'pragmas.db'}", future=True)
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        # 1 == NORMAL
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+
+
+def test_json_column_codec_roundtrips_tags(tmp_path: Path) -> None:
+    """Tags should survive the engine's JSON column serializer unchanged."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'json.db'}",
+        future=True,
+        json_serializer=_json_dumps,
+        json_deserializer=_json_loads,
+    )
+    Base.metadata.create_all(bind=engine)
+    repo = SqlAlchemyTodoRepository(
+        sessionmaker(bind=engine, expire_on_commit=False, class_=Session)
+    )
+
+    tags = ["a, b", "ünïcode", "c"]
+    assert _json_loads(_json_dumps(tags)) == tags
+
+    now = datetime.utcnow()
+    saved = repo.add(
+        TodoItem(
+            id=None,
+            title="json",
+            description=None,
+            status=Status.PENDING,
+            created_at=now,
+            updated_at=now,
+            tags=tags,
+        )
+    )
+    fetched = repo.get(saved.id or 0)
+    assert fetched is not None
+    assert fetched.tags == tags
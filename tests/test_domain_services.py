@@ -1,11 +1,18 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from datetime import date, datetime, timedelta
 
-from todo_app.domain.models import Priority, Status, TodoItem
+from todo_app.domain.clock import FrozenClock
+from todo_app.domain.models import Priority, Status, TodoItem, TodoSummary
 from todo_app.domain.repositories import TodoRepository
-from todo_app.domain.services import create_todo, list_todos, toggle_done
+from todo_app.domain.services import (
+    create_todo,
+    list_todo_summaries,
+    list_todos,
+    toggle_done,
+    update_todo,
+)
 
 
 class InMemoryTodoRepository(TodoRepository):
@@ -13,41 +20,87 @@ class InMemoryTodoRepository(TodoRepository):
 
     def __init__(self) -> None:
         """Initialize an empty in-memory store."""
-        self._items: list[TodoItem] = []
+        # Dicts keep insertion order; listings walk it backwards, newest first.
+        self._by_id: dict[int, TodoItem] = {}
         self._next_id: int = 1
 
     def add(self, item: TodoItem) -> TodoItem:
         item.id = self._next_id
+        self._by_id[self._next_id] = item
         self._next_id += 1
-        self._items.append(item)
         return item
 
-    def list_all(self) -> Sequence[TodoItem]:
-        return list(self._items)
+    def bulk_add(self, items: Sequence[TodoItem]) -> list[TodoItem]:
+        return [self.add(item) for item in items]
+
+    def list_all(
+        self,
+        status: Status | None = None,
+        priority: Priority | None = None,
+        due_on_or_before: date | None = None,
+        limit: int | None = None,
+        after_id: int | None = None,
+    ) -> Sequence[TodoItem]:
+        items = list(reversed(self._by_id.values()))
+        if status is not None:
+            items = [item for item in items if item.status == status]
+        if priority is not None:
+            items = [item for item in items if item.priority == priority]
+        if due_on_or_before is not None:
+            items = [
+                item
+                for item in items
+                if item.due_date is not None and item.due_date <= due_on_or_before
+            ]
+        if after_id is not None and after_id not in self._by_id:
+            msg = f"Item with id {after_id} not found"
+            raise ValueError(msg)
+        if after_id is not None:
+            # Ids grow with insertion order, so older items have smaller ids.
+            items = [item for item in items if (item.id or 0) < after_id]
+        if limit is not None:
+            items = items[:limit]
+        return items
+
+    def list_summaries(
+        self,
+        status: Status | None = None,
+        priority: Priority | None = None,
+        due_on_or_before: date | None = None,
+    ) -> Sequence[TodoSummary]:
+        return [
+            TodoSummary(item.id or 0, item.title, item.status, item.due_date)
+            for item in self.list_all(status, priority, due_on_or_before)
+        ]
+
+    def iter_all(self) -> Iterator[TodoItem]:
+        return iter(list(reversed(self._by_id.values())))
 
     def get(self, item_id: int) -> TodoItem | None:
-        for item in self._items:
-            if item.id == item_id:
-                return item
-        return None
+        return self._by_id.get(item_id)
 
     def update(self, item: TodoItem) -> TodoItem:
-        for idx, existing in enumerate(self._items):
-            if existing.id == item.id:
-                self._items[idx] = item
-                return item
-        msg = f"Item with id {item.id} not found"
-        raise ValueError(msg)
+        if item.id is None or item.id not in self._by_id:
+            msg = f"Item with id {item.id} not found"
+            raise ValueError(msg)
+        self._by_id[item.id] = item
+        return item
 
     def delete(self, item_id: int) -> None:
-        self._items = [item for item in self._items if item.id != item_id]
+        self._by_id.pop(item_id, None)
 
-    def set_status(self, item_id: int, status: Status) -> TodoItem | None:
+    def set_status(
+        self,
+        item_id: int,
+        status: Status,
+        *,
+        updated_at: datetime | None = None,
+    ) -> TodoItem | None:
         item = self.get(item_id)
         if item is None:
             return None
         item.status = status
-        item.updated_at = datetime.utcnow()
+        item.updated_at = updated_at or datetime.utcnow()
         return item
 
 
@@ -139,3 +192,97 @@ def test_priority_filter() -> None:
     high_only = list_todos(repo=repo, priority=Priority.HIGH)
     titles = {item.title for item in high_only}
     assert titles == {"High task"}
+
+
+def test_injected_clock_stamps_created_and_updated_items() -> None:
+    """Services should take timestamps from the injected clock."""
+    repo = InMemoryTodoRepository()
+    created_clock = FrozenClock(datetime(2025, 1, 1, 9, 0))
+    updated_clock = FrozenClock(datetime(2025, 1, 2, 9, 0))
+
+    created = create_todo(repo=repo, title="Clocked", clock=created_clock)
+    assert created.created_at == created_clock.now()
+    assert created.updated_at == created_clock.now()
+
+    updated = update_todo(
+        repo=repo,
+        item_id=created.id or 0,
+        title="Clocked again",
+        description=None,
+        due_date=None,
+        priority=None,
+        tags=None,
+        clock=updated_clock,
+    )
+    assert updated is not None
+    assert updated.created_at == created_clock.now()
+    assert updated.updated_at == updated_clock.now()
+
+    toggle_clock = FrozenClock(datetime(2025, 1, 3, 9, 0))
+    toggled = toggle_done(repo=repo, item_id=created.id or 0, clock=toggle_clock)
+    assert toggled is not None
+    assert toggled.updated_at == toggle_clock.now()
+
+
+def test_list_todos_paginates() -> None:
+    """list_todos should page through items newest first."""
+    repo = InMemoryTodoRepository()
+    for idx in range(5):
+        create_todo(repo=repo, title=f"Task {idx}")
+
+    first_page = list_todos(repo=repo, limit=2)
+    assert [item.title for item in first_page] == ["Task 4", "Task 3"]
+
+    second_page = list_todos(repo=repo, limit=2, after_id=first_page[-1].id)
+    assert [item.title for item in second_page] == ["Task 2", "Task 1"]
+
+    last_page = list_todos(repo=repo, limit=2, after_id=second_page[-1].id)
+    assert [item.title for item in last_page] == ["Task 0"]
+
+
+def test_combined_filters_are_all_applied() -> None:
+    """Combining filters should only return items matching every filter."""
+    repo = InMemoryTodoRepository()
+    ref_date = date(2025, 1, 10)
+
+    create_todo(repo=repo, title="Match", priority=Priority.HIGH, due_date=ref_date)
+    create_todo(repo=repo, title="Low", priority=Priority.LOW, due_date=ref_date)
+    create_todo(repo=repo, title="Undated", priority=Priority.HIGH)
+    done = create_todo(
+        repo=repo, title="Done", priority=Priority.HIGH, due_date=ref_date
+    )
+    toggle_done(repo=repo, item_id=done.id or 0)
+
+    filtered = list_todos(
+        repo=repo,
+        status=Status.PENDING,
+        priority=Priority.HIGH,
+        due_today_or_overdue=True,
+        reference_date=ref_date,
+    )
+    assert [item.title for item in filtered] == ["Match"]
+
+
+def test_list_todo_summaries_applies_filters() -> None:
+    """Summaries should carry the summary fields of matching items only."""
+    repo = InMemoryTodoRepository()
+    ref_date = date(2025, 1, 10)
+
+    due = create_todo(repo=repo, title="Due", priority=Priority.HIGH, due_date=ref_date)
+    create_todo(repo=repo, title="Low", priority=Priority.LOW, due_date=ref_date)
+    create_todo(
+        repo=repo,
+        title="Future",
+        priority=Priority.HIGH,
+        due_date=ref_date + timedelta(days=1),
+    )
+
+    summaries = list_todo_summaries(
+        repo=repo,
+        priority=Priority.HIGH,
+        due_today_or_overdue=True,
+        reference_date=ref_date,
+    )
+    assert list(summaries) == [
+        TodoSummary(due.id or 0, "Due", Status.PENDING, ref_date)
+    ]
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
+import threading
 from collections.abc import Iterator
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from todo_app.domain.models import Priority, Status, TodoItem
-from todo_app.infrastructure.db import Base
+from todo_app.domain.models import Priority, Status, TodoItem, TodoSummary
+from todo_app.domain.services import create_todo, toggle_done
+from todo_app.infrastructure.db import (
+    Base,
+    _emit_begin,
+    _set_sqlite_pragmas,
+    _use_explicit_transactions,
+)
 from todo_app.infrastructure.repositories import SqlAlchemyTodoRepository
 
 
@@ -46,6 +53,7 @@ def _make_item(
     description: str | None = None,
     status: Status = Status.PENDING,
     priority: Priority | None = None,
+    due_date: date | None = None,
 ) -> TodoItem:
     """Helper to create a TodoItem with timestamps set."""
     now = datetime.utcnow()
@@ -56,7 +64,7 @@ def _make_item(
         status=status,
         created_at=now,
         updated_at=now,
-        due_date=date.today(),
+        due_date=due_date or date.today(),
         priority=priority,
         tags=["repo", "test"],
     )
@@ -119,3 +127,306 @@ def test_set_status_persists_status_change(
     fetched = repo.get(saved.id or 0)
     assert fetched is not None
     assert fetched.status == Status.DONE
+
+
+def test_set_status_stamps_updated_at(repo: SqlAlchemyTodoRepository) -> None:
+    """set_status should use the given timestamp, or the current time."""
+    saved = repo.add(_make_item(title="stamped"))
+
+    explicit = datetime(2030, 1, 1, 12, 0)
+    updated = repo.set_status(saved.id or 0, Status.DONE, updated_at=explicit)
+    assert updated is not None
+    assert updated.updated_at == explicit
+
+    before = datetime.utcnow()
+    stamped = repo.set_status(saved.id or 0, Status.PENDING)
+    assert stamped is not None
+    assert stamped.updated_at >= before
+
+
+def test_toggle_right_after_create_keeps_updated_at_ordered(
+    repo: SqlAlchemyTodoRepository,
+) -> None:
+    """A toggle within the same second should not predate the creation."""
+    created = create_todo(repo=repo, title="quick")
+
+    toggled = toggle_done(repo=repo, item_id=created.id or 0)
+    assert toggled is not None
+    assert toggled.updated_at >= toggled.created_at
+
+
+def test_list_all_applies_filters_in_query(
+    repo: SqlAlchemyTodoRepository,
+) -> None:
+    """list_all should only return rows matching every given filter."""
+    today = date.today()
+    repo.add(_make_item(title="high-due", priority=Priority.HIGH, due_date=today))
+    repo.add(
+        _make_item(
+            title="high-future",
+            priority=Priority.HIGH,
+            due_date=today + timedelta(days=3),
+        )
+    )
+    repo.add(_make_item(title="low-due", priority=Priority.LOW, due_date=today))
+    repo.add(
+        _make_item(
+            title="high-done",
+            status=Status.DONE,
+            priority=Priority.HIGH,
+            due_date=today,
+        )
+    )
+
+    items = repo.list_all(
+        status=Status.PENDING,
+        priority=Priority.HIGH,
+        due_on_or_before=today,
+    )
+    assert [item.title for item in items] == ["high-due"]
+
+    done = repo.list_all(status=Status.DONE)
+    assert [item.title for item in done] == ["high-done"]
+
+
+def test_unit_of_work_commits_all_operations_together(
+    repo: SqlAlchemyTodoRepository,
+    session_factory: sessionmaker[Session],
+) -> None:
+    """Operations inside a unit of work should share one transaction."""
+    with repo.unit_of_work():
+        first = repo.add(_make_item(title="first"))
+        repo.add(_make_item(title="second"))
+        repo.set_status(first.id or 0, Status.DONE)
+
+    fresh = SqlAlchemyTodoRepository(session_factory)
+    items = {item.title: item for item in fresh.list_all()}
+    assert set(items) == {"first", "second"}
+    assert items["first"].status == Status.DONE
+
+
+def test_unit_of_work_rolls_back_on_error(
+    repo: SqlAlchemyTodoRepository,
+) -> None:
+    """A failing unit of work should not persist any of its operations."""
+    with pytest.raises(RuntimeError), repo.unit_of_work():
+        repo.add(_make_item(title="discarded"))
+        raise RuntimeError("boom")
+
+    assert list(repo.list_all()) == []
+
+
+def test_unit_of_work_keeps_completed_operations_when_interrupted(
+    repo: SqlAlchemyTodoRepository,
+) -> None:
+    """Control-flow interruptions should not discard completed operations."""
+
+    class StopRun(BaseException):
+        pass
+
+    with pytest.raises(StopRun), repo.unit_of_work():
+        repo.add(_make_item(title="kept"))
+        raise StopRun
+
+    assert [item.title for item in repo.list_all()] == ["kept"]
+
+
+def test_unit_of_work_is_scoped_to_the_current_thread(
+    repo: SqlAlchemyTodoRepository,
+    session_factory: sessionmaker[Session],
+) -> None:
+    """Other threads should not join a unit of work opened by this thread."""
+    with repo.unit_of_work():
+        worker = threading.Thread(
+            target=lambda: repo.add(_make_item(title="from-thread"))
+        )
+        worker.start()
+        worker.join()
+
+        fresh = SqlAlchemyTodoRepository(session_factory)
+        assert [item.title for item in fresh.list_all()] == ["from-thread"]
+
+
+def test_write_unit_of_work_after_read_and_concurrent_commit(
+    tmp_path: Path,
+) -> None:
+    """A write after a listing should not fail on another thread's commit."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}", future=True)
+    event.listen(engine, "connect", _use_explicit_transactions)
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    event.listen(engine, "begin", _emit_begin)
+    Base.metadata.create_all(bind=engine)
+    repo = SqlAlchemyTodoRepository(
+        sessionmaker(bind=engine, expire_on_commit=False, class_=Session)
+    )
+    saved = repo.add(_make_item(title="before"))
+    item_id = saved.id or 0
+
+    assert [item.title for item in repo.list_all()] == ["before"]
+    worker = threading.Thread(target=lambda: repo.set_status(item_id, Status.DONE))
+    worker.start()
+    worker.join()
+
+    with repo.unit_of_work():
+        current = repo.get(item_id)
+        assert current is not None
+        current.title = "after"
+        repo.update(current)
+
+    fetched = repo.get(item_id)
+    assert fetched is not None
+    assert fetched.title == "after"
+    assert fetched.status == Status.DONE
+
+
+def test_external_session_is_left_for_caller_to_commit(
+    session_factory: sessionmaker[Session],
+) -> None:
+    """A repository bound to a session should not commit it on its own."""
+    with session_factory() as session:
+        bound = SqlAlchemyTodoRepository(session=session)
+        bound.add(_make_item(title="pending-commit"))
+        session.rollback()
+
+    assert list(SqlAlchemyTodoRepository(session_factory).list_all()) == []
+
+
+def test_update_and_delete_are_visible_within_unit_of_work(
+    repo: SqlAlchemyTodoRepository,
+) -> None:
+    """Writes should be reflected by reads in the same unit of work."""
+    with repo.unit_of_work():
+        saved = repo.add(_make_item(title="before"))
+        assert repo.get(saved.id or 0) is not None
+
+        saved.title = "after"
+        updated = repo.update(saved)
+        assert updated.title == "after"
+        fetched = repo.get(saved.id or 0)
+        assert fetched is not None
+        assert fetched.title == "after"
+
+        repo.delete(saved.id or 0)
+        assert repo.get(saved.id or 0) is None
+
+
+def test_missing_items_are_reported(repo: SqlAlchemyTodoRepository) -> None:
+    """Writes against unknown ids should signal that nothing was found."""
+    missing = _make_item(title="missing")
+    missing.id = 999
+
+    assert repo.set_status(999, Status.DONE) is None
+    with pytest.raises(ValueError):
+        repo.update(missing)
+    repo.delete(999)
+
+
+def test_tags_roundtrip_as_list(repo: SqlAlchemyTodoRepository) -> None:
+    """Tags should be stored as a list, including tags containing commas."""
+    item = _make_item(title="tagged")
+    item.tags = ["a, b", "c"]
+    saved = repo.add(item)
+
+    fetched = repo.get(saved.id or 0)
+    assert fetched is not None
+    assert fetched.tags == ["a, b", "c"]
+
+    untagged = _make_item(title="untagged")
+    untagged.tags = []
+    assert repo.add(untagged).tags == []
+
+
+def test_list_all_cache_is_dropped_on_write(
+    repo: SqlAlchemyTodoRepository,
+    engine: Engine,
+) -> None:
+    """Repeated listings should be cached until the repository writes."""
+    saved = repo.add(_make_item(title="cached"))
+    statements: list[str] = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda _conn, _cursor, statement, *_args: statements.append(statement),
+    )
+
+    first = repo.list_all()
+    assert repo.list_all() == first
+    assert len(statements) == 1
+
+    repo.set_status(saved.id or 0, Status.DONE)
+    after_write = repo.list_all()
+    assert after_write[0].status == Status.DONE
+    assert len(statements) == 3
+
+
+def test_list_all_cache_hands_out_copies(repo: SqlAlchemyTodoRepository) -> None:
+    """Mutating a listed item should not change later cached listings."""
+    repo.add(_make_item(title="original"))
+
+    listed = repo.list_all()[0]
+    listed.title = "MUTATED"
+    listed.tags.append("extra")
+
+    cached = repo.list_all()[0]
+    assert cached.title == "original"
+    assert cached.tags == ["repo", "test"]
+
+
+def test_list_all_pages_by_keyset(repo: SqlAlchemyTodoRepository) -> None:
+    """Following after_id cursors should walk every item exactly once."""
+    base = datetime(2025, 1, 1)
+    for idx in range(5):
+        item = _make_item(title=f"task-{idx}")
+        item.created_at = base + timedelta(minutes=idx)
+        repo.add(item)
+
+    titles: list[str] = []
+    after_id: int | None = None
+    while page := repo.list_all(limit=2, after_id=after_id):
+        assert len(page) <= 2
+        titles.extend(item.title for item in page)
+        after_id = page[-1].id
+
+    assert titles == [f"task-{idx}" for idx in reversed(range(5))]
+    assert [item.title for item in repo.iter_all()] == titles
+
+
+def test_list_all_rejects_deleted_cursor(repo: SqlAlchemyTodoRepository) -> None:
+    """Paging after a deleted item should fail instead of ending early."""
+    first = repo.add(_make_item(title="first"))
+    cursor = repo.add(_make_item(title="cursor"))
+    repo.delete(cursor.id or 0)
+
+    with pytest.raises(ValueError):
+        repo.list_all(limit=2, after_id=cursor.id)
+    assert repo.list_all(after_id=first.id) == ()
+
+
+def test_list_summaries_returns_filtered_projection(
+    repo: SqlAlchemyTodoRepository,
+) -> None:
+    """list_summaries should apply filters and return only summary fields."""
+    pending = repo.add(_make_item(title="pending", priority=Priority.LOW))
+    repo.add(_make_item(title="done", status=Status.DONE, priority=Priority.LOW))
+
+    summaries = repo.list_summaries(status=Status.PENDING, priority=Priority.LOW)
+    assert summaries == [
+        TodoSummary(pending.id or 0, "pending", Status.PENDING, pending.due_date)
+    ]
+
+
+def test_bulk_add_assigns_ids_in_input_order(
+    repo: SqlAlchemyTodoRepository,
+) -> None:
+    """bulk_add should persist every item and return them with their ids."""
+    saved = repo.bulk_add([_make_item(title=f"bulk-{idx}") for idx in range(3)])
+
+    assert [item.title for item in saved] == ["bulk-0", "bulk-1", "bulk-2"]
+    for item in saved:
+        assert item.id is not None
+        fetched = repo.get(item.id)
+        assert fetched is not None
+        assert fetched.title == item.title
+        assert fetched.tags == ["repo", "test"]
+
+    assert repo.bulk_add([]) == []
@@ -43,3 +43,6 @@ class TestParseTags:
 
     def test_only_commas_and_spaces_returns_empty_list(self) -> None:
         assert parse_tags(" , ,  , ") == []
+
+    def test_keeps_inner_whitespace_and_single_characters(self) -> None:
+        assert parse_tags("my tag, a ,b") == ["my tag", "a", "b"]